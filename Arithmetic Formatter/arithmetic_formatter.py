@@ -12,14 +12,20 @@ Usage as a library:
 CLI usage:
     python -m arithmetic_formatter "32 + 8" "1 - 3801" --answers
 """
-from typing import Iterable, List
+from typing import Iterable, List, Optional, Tuple
+
+
+# Widest possible column: four digits + operator + space
+_DASHES = "-" * 6
 
 
 class ArithmeticFormatterError(ValueError):
     pass
 
 
-def _validate_problem(problem: str) -> None:
+# _parse and _arrange are also used by arithmetic_formatter_fast, so both
+# formatters validate and lay out problems identically
+def _parse(problem: str) -> Tuple[str, str, str]:
     parts = problem.split()
     if len(parts) != 3:
         raise ArithmeticFormatterError(f"Invalid problem format: {problem!r}. Expected 'operand operator operand'.")
@@ -35,6 +41,8 @@ def _validate_problem(problem: str) -> None:
     if len(left) > 4 or len(right) > 4:
         raise ArithmeticFormatterError("Error: Numbers cannot be more than four digits.")
 
+    return left, op, right
+
 
 def arithmetic_formatter(problems: Iterable[str], display_answers: bool = False, spacing: int = 4) -> str:
     """Arrange arithmetic problems vertically and side-by-side.
@@ -58,35 +66,30 @@ def arithmetic_formatter(problems: Iterable[str], display_answers: bool = False,
     if len(problems) > 5:
         raise ArithmeticFormatterError("Error: Too many problems.")
 
-    # Validate all problems first
-    for p in problems:
-        _validate_problem(p)
+    # Validate all problems first, keeping the parsed operands
+    parsed = [_parse(p) for p in problems]
 
-    line1: List[str] = []
-    line2: List[str] = []
-    dashes: List[str] = []
-    results: List[str] = []
+    answers = None
+    if display_answers:
+        apply_op = {"+": int.__add__, "-": int.__sub__}
+        answers = [apply_op[op](int(left), int(right)) for left, op, right in parsed]
+
+    return _arrange(parsed, answers, spacing)
 
-    for p in problems:
-        left, op, right = p.split()
-        width = max(len(left), len(right)) + 2  # operator + space + widest operand
 
-        line1.append(left.rjust(width))
-        line2.append(op + right.rjust(width - 1))
-        dashes.append("-" * width)
+def _arrange(parsed: List[Tuple[str, str, str]], answers: Optional[List[int]], spacing: int) -> str:
+    """Lay out already-validated problems; `answers` is None or one int per problem."""
+    widths = [max(len(left), len(right)) + 2 for left, _, right in parsed]  # operator + space + widest operand
 
-        if display_answers:
-            if op == "+":
-                res = int(left) + int(right)
-            else:
-                res = int(left) - int(right)
-            results.append(str(res).rjust(width))
+    line1 = [left.rjust(w) for (left, _, _), w in zip(parsed, widths)]
+    line2 = [op + right.rjust(w - 1) for (_, op, right), w in zip(parsed, widths)]
+    dashes = [_DASHES[:w] for w in widths]
 
     gap = " " * spacing
-    arranged = gap.join(line1) + "\n" + gap.join(line2) + "\n" + gap.join(dashes)
-    if display_answers:
-        arranged += "\n" + gap.join(results)
-    return arranged
+    parts = [gap.join(line1), gap.join(line2), gap.join(dashes)]
+    if answers is not None:
+        parts.append(gap.join([str(a).rjust(w) for a, w in zip(answers, widths)]))
+    return "\n".join(parts)
 
 
 def _demo():
@@ -96,7 +99,7 @@ def _demo():
     print(arithmetic_formatter(samples, display_answers=True))
 
 
-def main(argv: List[str] | None = None) -> int:
+def main(argv: Optional[List[str]] = None) -> int:
     import argparse
     parser = argparse.ArgumentParser(description="Neatly arrange arithmetic problems.")
     parser.add_argument("problems", nargs="*", help="Problems like '32 + 698' (max 5).")
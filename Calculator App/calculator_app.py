@@ -2,6 +2,8 @@
 import tkinter as tk
 from tkinter import ttk
 import ast
+import re
+from functools import lru_cache, partial
 
 APP_TITLE = "Python Calculator"
 APP_WIDTH = 320
@@ -13,38 +15,71 @@ ALLOWED_NODES = (
     ast.USub, ast.UAdd, ast.FloorDiv, ast.Call, ast.Name
 )
 
+# Any number str(int|float) can display, e.g. 5, 5., .5, 2.5, 1e-05
+_NUMBER_RE = re.compile(r"^-?(\d+\.?\d*|\.\d+)([eE][-+]?\d+)?$")
+
 SAFE_FUNCS = {
     "abs": abs,
     "round": round
 }
 
-def safe_eval(expr: str):
+_ALLOWED_TYPES = frozenset(ALLOWED_NODES)
+
+@lru_cache(maxsize=256)
+def _prepare(expr: str):
     """
-    Safely evaluate a mathematical expression using Python's AST.
-    Supports +, -, *, /, //, %, **, parentheses, unary +/-, and a few safe funcs.
+    Parse, validate and compile an expression once; repeat calls hit the cache.
+    Returns (code, is_const, value). Expressions without names are evaluated
+    here, so later calls skip eval entirely.
     """
     try:
         tree = ast.parse(expr, mode="eval")
     except SyntaxError:
         raise ValueError("Invalid syntax")
 
-    for node in ast.walk(tree):
-        if isinstance(node, ast.Call):
-            if not isinstance(node.func, ast.Name) or node.func.id not in SAFE_FUNCS:
+    # Single iterative pass over the tree, dispatching on exact node type
+    has_names = False
+    stack = [tree]
+    while stack:
+        node = stack.pop()
+        node_type = type(node)
+        if node_type is ast.Call:
+            if type(node.func) is not ast.Name or node.func.id not in SAFE_FUNCS:
                 raise ValueError("Function not allowed")
-        elif isinstance(node, ast.Name):
+        elif node_type is ast.Name:
             if node.id not in SAFE_FUNCS:
                 raise ValueError("Name not allowed")
-        elif not isinstance(node, ALLOWED_NODES):
+            has_names = True
+        elif node_type not in _ALLOWED_TYPES:
             raise ValueError("Operation not allowed")
+        stack.extend(ast.iter_child_nodes(node))
 
-    return eval(compile(tree, "<ast>", "eval"), {"__builtins__": {}}, SAFE_FUNCS)
+    code = compile(tree, "<ast>", "eval")
+    if has_names:
+        return code, False, None
+    return code, True, eval(code, {"__builtins__": {}}, SAFE_FUNCS)
+
+def safe_eval(expr: str):
+    """
+    Safely evaluate a mathematical expression using Python's AST.
+    Supports +, -, *, /, //, %, **, parentheses, unary +/-, and a few safe funcs.
+    """
+    code, is_const, value = _prepare(expr)
+    if is_const:
+        return value
+    return eval(code, {"__builtins__": {}}, SAFE_FUNCS)
 
 class Calculator(ttk.Frame):
     def __init__(self, master):
         super().__init__(master, padding=10)
         self.master = master
         self.expr = tk.StringVar(value="")
+        self._actions = {
+            "C": self._clear,
+            "⌫": self._backspace,
+            "±": self.toggle_sign,
+            "=": self.calculate,
+        }
         self.create_widgets()
         self.bind_keys()
 
@@ -89,7 +124,7 @@ class Calculator(ttk.Frame):
         row = 0
         col = 0
         for text, colspan, rowspan in btns:
-            btn = ttk.Button(grid, text=text, command=lambda t=text: self.on_button(t))
+            btn = ttk.Button(grid, text=text, command=partial(self.on_button, text))
             btn.grid(row=row, column=col, columnspan=colspan, rowspan=rowspan, sticky="nsew", padx=4, pady=4)
             col += 1
             if col > 3:
@@ -110,20 +145,17 @@ class Calculator(ttk.Frame):
             self.expr.set(self.expr.get() + ch)
 
     def on_button(self, label):
-        if label == "C":
-            self.expr.set("")
-        elif label == "⌫":
-            self.expr.set(self.expr.get()[:-1])
-        elif label == "±":
-            self.toggle_sign()
-        elif label == "=":
-            self.calculate()
+        action = self._actions.get(label)
+        if action is not None:
+            action()
         else:
-            # insert with spacing for readability around operators (optional)
-            if label in {"+", "-", "*", "/", "%", "//", "**"}:
-                self.expr.set(self.expr.get() + label)
-            else:
-                self.expr.set(self.expr.get() + label)
+            self.expr.set(self.expr.get() + label)
+
+    def _clear(self):
+        self.expr.set("")
+
+    def _backspace(self):
+        self.expr.set(self.expr.get()[:-1])
 
     def toggle_sign(self):
         s = self.expr.get().strip()
@@ -131,16 +163,9 @@ class Calculator(ttk.Frame):
             self.expr.set("-")
             return
         # If it's a single number
-        try:
-            val = safe_eval(s)
-            if isinstance(val, (int, float)):
-                if str(s).startswith("-"):
-                    self.expr.set(s[1:])
-                else:
-                    self.expr.set("-" + s)
-                return
-        except Exception:
-            pass
+        if _NUMBER_RE.match(s):
+            self.expr.set(s[1:] if s.startswith("-") else "-" + s)
+            return
         # Otherwise, wrap last number with -( )
         i = len(s) - 1
         while i >= 0 and (s[i].isdigit() or s[i] == "."):
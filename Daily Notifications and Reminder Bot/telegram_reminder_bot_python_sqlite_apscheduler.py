@@ -13,6 +13,7 @@ Quickstart
 1) Create a Telegram bot with @BotFather and copy the token.
 2) Python 3.10+ recommended. Install deps:
    pip install python-telegram-bot==21.4 APScheduler==3.10.4 python-dateutil==2.9.0.post0
+   (optional) pip install "pandas>=2.0"  – faster timezone conversion for long task lists
 3) Set env var TELEGRAM_BOT_TOKEN and run:
    python bot.py
 
@@ -34,25 +35,40 @@ Note: Use the vertical bar `|` to separate the time from the task text.
 """
 
 import asyncio
+import functools
 import logging
 import os
 import re
 import sqlite3
-from contextlib import closing
+import threading
 from dataclasses import dataclass
 from datetime import datetime, timedelta, time
 from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
+from apscheduler.jobstores.base import JobLookupError
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.date import DateTrigger
 from dateutil import tz
 from dateutil.parser import parse as parse_dt
 from telegram import Update
 from telegram.constants import ParseMode
 from telegram.ext import Application, CommandHandler, ContextTypes, MessageHandler, filters
 
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+# Bulk conversion parses with format="ISO8601", which needs pandas 2.0+
+if pd is not None and int(pd.__version__.split(".")[0]) < 2:
+    pd = None
+
 DB_PATH = os.environ.get("REMINDER_BOT_DB", "reminders.db")
 DEFAULT_TZ = "UTC"
 DAILY_SUMMARY_DEFAULT = None  # HH:MM string or None
+# Only keep timers in memory for reminders due this far ahead; a daily job tops the window up
+RESCHEDULE_WINDOW = timedelta(days=30)
+RESCHEDULE_LIMIT = 10_000
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
 logger = logging.getLogger(__name__)
@@ -73,56 +89,74 @@ CREATE TABLE IF NOT EXISTS tasks (
   done INTEGER NOT NULL DEFAULT 0,
   created_utc TEXT NOT NULL
 );
+
+-- due_utc is fixed-width ISO-8601, so plain string order is chronological
+CREATE INDEX IF NOT EXISTS idx_tasks_chat_done_due ON tasks(chat_id, done, due_utc);
+CREATE INDEX IF NOT EXISTS idx_tasks_due_pending ON tasks(due_utc) WHERE done=0;
 """
 
 
-def db_connect():
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row
-    return conn
+# One connection shared by every handler (autocommit, WAL); writes are serialized by _LOCK.
+_CONN: sqlite3.Connection | None = None
+_LOCK = threading.Lock()
 
 
 def init_db():
-    with closing(db_connect()) as conn:
-        conn.executescript(SCHEMA)
-        conn.commit()
+    global _CONN
+    if _CONN is None:
+        _CONN = sqlite3.connect(DB_PATH, check_same_thread=False, isolation_level=None)
+        _CONN.row_factory = sqlite3.Row
+        _CONN.execute("PRAGMA journal_mode=WAL")
+        _CONN.execute("PRAGMA synchronous=NORMAL")
+        _CONN.execute("PRAGMA temp_store=MEMORY")
+    with _LOCK:
+        _CONN.executescript(SCHEMA)
 
 
 # ---------------------- UTILITIES ----------------------
 def get_user_tz(chat_id: int) -> str:
-    with closing(db_connect()) as conn:
-        cur = conn.execute("SELECT tz FROM users WHERE chat_id=?", (chat_id,))
-        row = cur.fetchone()
-        return row["tz"] if row else DEFAULT_TZ
+    row = _CONN.execute("SELECT tz FROM users WHERE chat_id=?", (chat_id,)).fetchone()
+    return row["tz"] if row else DEFAULT_TZ
 
 
 def set_user_tz(chat_id: int, tzname: str, daily_time: str | None = None):
-    with closing(db_connect()) as conn:
-        conn.execute(
+    with _LOCK:
+        _CONN.execute(
             "INSERT INTO users(chat_id, tz, daily_time) VALUES(?,?,?) "
             "ON CONFLICT(chat_id) DO UPDATE SET tz=excluded.tz, daily_time=COALESCE(excluded.daily_time, users.daily_time)",
             (chat_id, tzname, daily_time),
         )
-        conn.commit()
+
+
+def get_user_daily(chat_id: int) -> str | None:
+    row = _CONN.execute("SELECT daily_time FROM users WHERE chat_id=?", (chat_id,)).fetchone()
+    return row["daily_time"] if row else None
+
+
+def ensure_user(chat_id: int):
+    with _LOCK:
+        _CONN.execute(
+            "INSERT INTO users(chat_id, tz) VALUES(?,?) ON CONFLICT(chat_id) DO NOTHING",
+            (chat_id, DEFAULT_TZ),
+        )
 
 
 def set_user_daily(chat_id: int, daily_time: str | None):
-    with closing(db_connect()) as conn:
-        conn.execute(
+    # The tz value is only used when the row doesn't exist yet
+    with _LOCK:
+        _CONN.execute(
             "INSERT INTO users(chat_id, tz, daily_time) VALUES(?,?,?) "
             "ON CONFLICT(chat_id) DO UPDATE SET daily_time=excluded.daily_time",
-            (chat_id, get_user_tz(chat_id), daily_time),
+            (chat_id, DEFAULT_TZ, daily_time),
         )
-        conn.commit()
 
 
 def add_task(chat_id: int, text: str, due_utc: datetime) -> int:
-    with closing(db_connect()) as conn:
-        cur = conn.execute(
+    with _LOCK:
+        cur = _CONN.execute(
             "INSERT INTO tasks(chat_id, text, due_utc, created_utc) VALUES(?,?,?,?)",
-            (chat_id, text, due_utc.isoformat(), datetime.utcnow().isoformat()),
+            (chat_id, text, due_utc.isoformat(timespec="seconds"), datetime.utcnow().isoformat(timespec="seconds")),
         )
-        conn.commit()
         return cur.lastrowid
 
 
@@ -130,40 +164,58 @@ def list_tasks(chat_id: int, include_done: bool = False):
     q = "SELECT id, text, due_utc, done FROM tasks WHERE chat_id=? "
     if not include_done:
         q += "AND done=0 "
-    q += "ORDER BY datetime(due_utc) ASC"
-    with closing(db_connect()) as conn:
-        return [dict(r) for r in conn.execute(q, (chat_id,))]
+    q += "ORDER BY due_utc ASC"
+    return [dict(r) for r in _CONN.execute(q, (chat_id,))]
 
 
 def mark_done(chat_id: int, task_id: int) -> bool:
-    with closing(db_connect()) as conn:
-        cur = conn.execute(
+    with _LOCK:
+        cur = _CONN.execute(
             "UPDATE tasks SET done=1 WHERE chat_id=? AND id=? AND done=0",
             (chat_id, task_id),
         )
-        conn.commit()
         return cur.rowcount > 0
 
 
 def remove_task(chat_id: int, task_id: int) -> bool:
-    with closing(db_connect()) as conn:
-        cur = conn.execute("DELETE FROM tasks WHERE chat_id=? AND id=?", (chat_id, task_id))
-        conn.commit()
+    with _LOCK:
+        cur = _CONN.execute("DELETE FROM tasks WHERE chat_id=? AND id=?", (chat_id, task_id))
         return cur.rowcount > 0
 
 
 # ---------------------- PARSING ----------------------
 RELATIVE_RE = re.compile(r"^in\s+(\d+)\s*([mhd])$", re.IGNORECASE)
 TODAY_RE = re.compile(r"^(today|tomorrow)\s+(\d{1,2}:\d{2})$", re.IGNORECASE)
+# Formats we advertise; tried with strptime before falling back to dateutil
+_FAST_FORMATS = ("%Y-%m-%d %H:%M", "%Y-%m-%dT%H:%M", "%Y-%m-%d %H:%M:%S", "%Y-%m-%dT%H:%M:%S", "%Y-%m-%d")
+
+
+_UTC = ZoneInfo("UTC")
+
+
+@functools.lru_cache(maxsize=256)
+def _zi(name: str) -> ZoneInfo:
+    return ZoneInfo(name)
 
 
 def to_utc(dt_local: datetime, tzname: str) -> datetime:
-    z = ZoneInfo(tzname)
-    return dt_local.replace(tzinfo=z).astimezone(ZoneInfo("UTC")).replace(tzinfo=None)
+    return dt_local.replace(tzinfo=_zi(tzname)).astimezone(_UTC).replace(tzinfo=None)
 
 
 def from_utc(dt_utc: datetime, tzname: str) -> datetime:
-    return dt_utc.replace(tzinfo=ZoneInfo("UTC")).astimezone(ZoneInfo(tzname))
+    return dt_utc.replace(tzinfo=_UTC).astimezone(_zi(tzname))
+
+
+# Below this many rows the per-row conversion is cheaper than building a pandas index
+BULK_TZ_MIN_ROWS = 20
+
+
+def format_due_local(rows, tzname: str, fmt: str) -> list[str]:
+    """Format each row's due_utc in the user's timezone; converts in bulk for long lists."""
+    if pd is not None and len(rows) > BULK_TZ_MIN_ROWS:
+        due = pd.to_datetime([r["due_utc"] for r in rows], utc=True, format="ISO8601").tz_convert(tzname)
+        return due.strftime(fmt).tolist()
+    return [from_utc(datetime.fromisoformat(r["due_utc"]), tzname).strftime(fmt) for r in rows]
 
 
 def parse_when(when_str: str, tzname: str) -> datetime:
@@ -177,7 +229,7 @@ def parse_when(when_str: str, tzname: str) -> datetime:
     m2 = TODAY_RE.match(when_str)
     if m2:
         day_word, hhmm = m2.groups()
-        today_local = datetime.now(ZoneInfo(tzname)).date()
+        today_local = datetime.now(_zi(tzname)).date()
         if day_word.lower() == "tomorrow":
             target_date = today_local + timedelta(days=1)
         else:
@@ -186,13 +238,20 @@ def parse_when(when_str: str, tzname: str) -> datetime:
         dt_local = datetime.combine(target_date, time(h, mi))
         return to_utc(dt_local, tzname)
 
-    # Try absolute parsing (dateutil handles many formats, assume naive is local tz)
+    # Try absolute parsing (strptime for the common formats, then dateutil; assume naive is local tz)
     try:
-        dt = parse_dt(when_str, fuzzy=True)
+        for fmt in _FAST_FORMATS:
+            try:
+                dt = datetime.strptime(when_str, fmt)
+                break
+            except ValueError:
+                continue
+        else:
+            dt = parse_dt(when_str, fuzzy=True)
         if dt.tzinfo is None:
             dt = to_utc(dt, tzname)
         else:
-            dt = dt.astimezone(ZoneInfo("UTC")).replace(tzinfo=None)
+            dt = dt.astimezone(_UTC).replace(tzinfo=None)
         return dt
     except Exception as e:
         raise ValueError("Sorry, I couldn't parse that time. Try formats like '2025-09-01 09:00', 'today 18:30', or 'in 2h'.")
@@ -202,11 +261,51 @@ def parse_when(when_str: str, tzname: str) -> datetime:
 scheduler = AsyncIOScheduler()
 
 
+def schedule_reminder(app: Application, chat_id: int, task_id: int, due_utc: datetime):
+    scheduler.add_job(
+        send_reminder,
+        DateTrigger(run_date=due_utc, timezone=_UTC),
+        args=[app, chat_id, task_id],
+        id=f"reminder_{chat_id}_{task_id}",
+        replace_existing=True,
+        misfire_grace_time=3600,
+    )
+
+
+def cancel_reminder(chat_id: int, task_id: int):
+    try:
+        scheduler.remove_job(f"reminder_{chat_id}_{task_id}")
+    except JobLookupError:
+        pass
+
+
+def cancel_daily_summary(chat_id: int):
+    try:
+        scheduler.remove_job(f"daily_{chat_id}")
+    except JobLookupError:
+        pass
+
+
+def schedule_daily_summary(app: Application, chat_id: int, tzname: str, daily_time: str | None):
+    """(Re)register the user's daily summary cron job, or drop it when daily_time is None."""
+    if daily_time is None:
+        cancel_daily_summary(chat_id)
+        return
+    h, m = map(int, daily_time.split(":"))
+    scheduler.add_job(
+        send_daily_summary,
+        CronTrigger(hour=h, minute=m, timezone=_zi(tzname)),
+        args=[app, chat_id],
+        id=f"daily_{chat_id}",
+        replace_existing=True,
+    )
+
+
 async def send_reminder(app: Application, chat_id: int, task_id: int):
     # Fetch task; skip if done or missing
-    with closing(db_connect()) as conn:
-        cur = conn.execute("SELECT id, text, due_utc, done FROM tasks WHERE id=? AND chat_id=?", (task_id, chat_id))
-        row = cur.fetchone()
+    row = _CONN.execute(
+        "SELECT id, text, due_utc, done FROM tasks WHERE id=? AND chat_id=?", (task_id, chat_id)
+    ).fetchone()
     if not row or row["done"]:
         return
 
@@ -219,7 +318,7 @@ async def send_reminder(app: Application, chat_id: int, task_id: int):
             chat_id=chat_id,
             text=(
                 f"⏰ *Reminder:* {escape_md(text)}\n"
-                f"🗓️ Due: {due_local.strftime('%Y-%m-%d %H:%M')} ({tzname})"
+                f"🗓️ Due: {escape_md(f'{due_local:%Y-%m-%d %H:%M} ({tzname})')}"
             ),
             parse_mode=ParseMode.MARKDOWN_V2,
         )
@@ -229,29 +328,27 @@ async def send_reminder(app: Application, chat_id: int, task_id: int):
 
 async def send_daily_summary(app: Application, chat_id: int):
     tzname = get_user_tz(chat_id)
-    now_local = datetime.now(ZoneInfo(tzname))
+    now_local = datetime.now(_zi(tzname))
     start_utc = to_utc(datetime.combine(now_local.date(), time(0, 0)), tzname)
     end_utc = to_utc(datetime.combine(now_local.date(), time(23, 59)), tzname)
 
-    with closing(db_connect()) as conn:
-        rows = conn.execute(
-            "SELECT id, text, due_utc FROM tasks WHERE chat_id=? AND done=0 AND datetime(due_utc) BETWEEN ? AND ? ORDER BY datetime(due_utc)",
-            (chat_id, start_utc.isoformat(), end_utc.isoformat()),
-        ).fetchall()
+    rows = _CONN.execute(
+        "SELECT id, text, due_utc FROM tasks WHERE chat_id=? AND done=0 AND due_utc BETWEEN ? AND ? ORDER BY due_utc",
+        (chat_id, start_utc.isoformat(timespec="seconds"), end_utc.isoformat(timespec="seconds")),
+    ).fetchall()
 
     if not rows:
-        body = "No tasks due today. Have a great day!"
+        body = escape_md("No tasks due today. Have a great day!")
     else:
-        items = []
-        for r in rows:
-            local = from_utc(datetime.fromisoformat(r["due_utc"]), tzname)
-            items.append(f"• [{r['id']}] {escape_md(r['text'])} — {local.strftime('%H:%M')}")
-        body = "\n".join(items)
+        due_times = format_due_local(rows, tzname, "%H:%M")
+        body = "\n".join(
+            "• " + escape_md(f"[{r['id']}] {r['text']} — {due}") for r, due in zip(rows, due_times)
+        )
 
     try:
         await app.bot.send_message(
             chat_id=chat_id,
-            text=f"🗒️ *Today's summary* ({now_local.strftime('%Y-%m-%d')}, {tzname})\n\n" + body,
+            text=f"🗒️ *Today's summary* {escape_md(f'({now_local:%Y-%m-%d}, {tzname})')}\n\n" + body,
             parse_mode=ParseMode.MARKDOWN_V2,
         )
     except Exception as e:
@@ -259,15 +356,18 @@ async def send_daily_summary(app: Application, chat_id: int):
 
 
 # ---------------------- TELEGRAM HANDLERS ----------------------
+# Every MarkdownV2 special character (including the backslash itself) gets a leading backslash
+_MD_TABLE = str.maketrans({c: "\\" + c for c in "\\_*[]()~`>#+-=|{}.!"})
+
+
 def escape_md(text: str) -> str:
-    # Minimal escape for MarkdownV2 special characters
-    return re.sub(r"([_*>\\[\\]()~`>#+\-=|{}.!])", r"\\\\\1", text)
+    return text.translate(_MD_TABLE)
 
 
 async def start(update: Update, context: ContextTypes.DEFAULT_TYPE):
     chat_id = update.effective_chat.id
     # Ensure user row exists
-    set_user_tz(chat_id, get_user_tz(chat_id))
+    ensure_user(chat_id)
     await update.message.reply_text(
         "Hi! I can remind you about important tasks.\n\n"
         "Set your timezone first (once):\n"
@@ -293,11 +393,12 @@ async def settz(update: Update, context: ContextTypes.DEFAULT_TYPE):
         return
     tzname = context.args[0]
     try:
-        ZoneInfo(tzname)
+        _zi(tzname)
     except ZoneInfoNotFoundError:
         await update.message.reply_text("Invalid timezone. Try something like America/New_York or Europe/London.")
         return
     set_user_tz(chat_id, tzname)
+    schedule_daily_summary(context.application, chat_id, tzname, get_user_daily(chat_id))
     await update.message.reply_text(f"Timezone set to {tzname}.")
 
 
@@ -326,11 +427,7 @@ async def add(update: Update, context: ContextTypes.DEFAULT_TYPE):
     task_id = add_task(chat_id, task_part, due_utc)
 
     # Schedule reminder
-    context.application.job_queue.run_once(
-        lambda ctx: asyncio.create_task(send_reminder(context.application, chat_id, task_id)),
-        when=(due_utc - datetime.utcnow()),
-        name=f"reminder_{chat_id}_{task_id}",
-    )
+    schedule_reminder(context.application, chat_id, task_id, due_utc)
 
     due_local = from_utc(due_utc, tzname)
     await update.message.reply_text(
@@ -345,10 +442,8 @@ async def list_cmd(update: Update, context: ContextTypes.DEFAULT_TYPE):
     if not rows:
         await update.message.reply_text("No upcoming tasks.")
         return
-    lines = []
-    for r in rows:
-        due_local = from_utc(datetime.fromisoformat(r["due_utc"]), tzname)
-        lines.append(f"[{r['id']}] {r['text']} — {due_local.strftime('%Y-%m-%d %H:%M')} ({tzname})")
+    due_times = format_due_local(rows, tzname, "%Y-%m-%d %H:%M")
+    lines = [f"[{r['id']}] {r['text']} — {due} ({tzname})" for r, due in zip(rows, due_times)]
     await update.message.reply_text("\n".join(lines))
 
 
@@ -363,6 +458,7 @@ async def done_cmd(update: Update, context: ContextTypes.DEFAULT_TYPE):
         await update.message.reply_text("Task id must be a number.")
         return
     if mark_done(chat_id, tid):
+        cancel_reminder(chat_id, tid)
         await update.message.reply_text(f"Marked task [{tid}] as done.")
     else:
         await update.message.reply_text("Couldn't find an active task with that id.")
@@ -379,6 +475,7 @@ async def remove_cmd(update: Update, context: ContextTypes.DEFAULT_TYPE):
         await update.message.reply_text("Task id must be a number.")
         return
     if remove_task(chat_id, tid):
+        cancel_reminder(chat_id, tid)
         await update.message.reply_text(f"Removed task [{tid}].")
     else:
         await update.message.reply_text("Couldn't find a task with that id.")
@@ -392,53 +489,58 @@ async def daily_cmd(update: Update, context: ContextTypes.DEFAULT_TYPE):
     arg = context.args[0].lower()
     if arg == "off":
         set_user_daily(chat_id, None)
+        cancel_daily_summary(chat_id)
         await update.message.reply_text("Daily summary turned off.")
         return
     # validate HH:MM
-    if not re.match(r"^\d{2}:\d{2}$", arg):
+    if not re.match(r"^\d{2}:\d{2}$", arg) or int(arg[:2]) > 23 or int(arg[3:]) > 59:
         await update.message.reply_text("Please provide time as HH:MM (e.g., 09:00) or 'off'.")
         return
     set_user_daily(chat_id, arg)
+    schedule_daily_summary(context.application, chat_id, get_user_tz(chat_id), arg)
     await update.message.reply_text(f"Daily summary set to {arg} (your local time).")
 
 
-# ---------------------- RESCHEDULING & DAILY TICKS ----------------------
+# ---------------------- RESCHEDULING & DAILY SUMMARIES ----------------------
 async def reschedule_pending(app: Application):
-    """On startup, schedule all future, unfinished tasks."""
-    with closing(db_connect()) as conn:
-        rows = conn.execute(
-            "SELECT id, chat_id, due_utc FROM tasks WHERE done=0 AND datetime(due_utc) > datetime('now')"
-        ).fetchall()
-    for r in rows:
-        due_utc = datetime.fromisoformat(r["due_utc"])
-        delay = (due_utc - datetime.utcnow()).total_seconds()
-        app.job_queue.run_once(
-            lambda ctx, chat_id=r["chat_id"], task_id=r["id"]: asyncio.create_task(send_reminder(app, chat_id, task_id)),
-            when=max(1, delay),
-            name=f"reminder_{r['chat_id']}_{r['id']}",
-        )
+    """Schedule unfinished tasks due within RESCHEDULE_WINDOW (on startup, then daily)."""
+    now = datetime.utcnow()
+    rows = _CONN.execute(
+        "SELECT id, chat_id, due_utc FROM tasks WHERE done=0 AND due_utc > ? AND due_utc <= ? "
+        "ORDER BY due_utc LIMIT ?",
+        (now.isoformat(timespec="seconds"), (now + RESCHEDULE_WINDOW).isoformat(timespec="seconds"), RESCHEDULE_LIMIT),
+    ).fetchall()
+    # Pause job processing while bulk-adding so the scheduler isn't woken per insert
+    scheduler.pause()
+    try:
+        for r in rows:
+            schedule_reminder(app, r["chat_id"], r["id"], datetime.fromisoformat(r["due_utc"]))
+    finally:
+        scheduler.resume()
     logger.info("Rescheduled %d pending reminders", len(rows))
 
 
-async def schedule_daily_ticks(app: Application):
-    """Every minute, check who needs a daily summary right now and send it."""
-    async def tick(context: ContextTypes.DEFAULT_TYPE):
-        with closing(db_connect()) as conn:
-            users = conn.execute("SELECT chat_id, tz, daily_time FROM users WHERE daily_time IS NOT NULL").fetchall()
-        now_utc = datetime.utcnow().replace(second=0, microsecond=0)
-        for u in users:
-            tzname = u["tz"]
-            hhmm = u["daily_time"]
-            try:
-                z = ZoneInfo(tzname)
-            except Exception:
-                continue
-            now_local = datetime.now(z).replace(second=0, microsecond=0)
-            target_h, target_m = map(int, hhmm.split(":"))
-            if now_local.time() == time(target_h, target_m):
-                asyncio.create_task(send_daily_summary(app, u["chat_id"]))
-
-    app.job_queue.run_repeating(tick, interval=60, first=0)
+async def schedule_daily_summaries(app: Application):
+    """On startup, register one cron job per user who has a daily summary time."""
+    users = _CONN.execute("SELECT chat_id, tz, daily_time FROM users WHERE daily_time IS NOT NULL").fetchall()
+    for u in users:
+        try:
+            schedule_daily_summary(app, u["chat_id"], u["tz"], u["daily_time"])
+        except (ValueError, ZoneInfoNotFoundError):
+            logger.warning("Skipping daily summary for %s: bad tz/time %r %r", u["chat_id"], u["tz"], u["daily_time"])
+    logger.info("Scheduled %d daily summaries", len(users))
+
+
+async def post_init(app: Application):
+    scheduler.start()
+    scheduler.add_job(
+        reschedule_pending,
+        CronTrigger(hour=0, minute=0, timezone=_UTC),
+        args=[app],
+        id="reschedule_pending",
+        replace_existing=True,
+    )
+    await asyncio.gather(reschedule_pending(app), schedule_daily_summaries(app))
 
 
 # ---------------------- APP BOOT ----------------------
@@ -460,8 +562,8 @@ async def main():
     application.add_handler(CommandHandler("remove", remove_cmd))
     application.add_handler(CommandHandler("daily", daily_cmd))
 
-    # On start: schedule pending tasks and daily ticks
-    application.post_init = lambda app: asyncio.gather(reschedule_pending(app), schedule_daily_ticks(app))
+    # On start: schedule pending tasks and daily summaries
+    application.post_init = post_init
 
     await application.run_polling(close_loop=False)
 
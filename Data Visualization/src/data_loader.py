@@ -1,9 +1,20 @@
+from typing import List, Optional
+
 import pandas as pd
 
-def load_csv(file_path: str) -> pd.DataFrame:
-    """Load CSV file into a Pandas DataFrame."""
+# The pyarrow reader is multithreaded and dtype-directed; fall back to the C engine without it.
+# dtype_backend needs pandas 2.0+, so older pandas also uses the C engine.
+try:
+    import pyarrow  # noqa: F401
+    DEFAULT_ENGINE = "pyarrow" if int(pd.__version__.split(".")[0]) >= 2 else "c"
+except ImportError:
+    DEFAULT_ENGINE = "c"
+
+def load_csv(file_path: str, usecols: Optional[List[str]] = None, engine: str = DEFAULT_ENGINE) -> pd.DataFrame:
+    """Load CSV file into a Pandas DataFrame, optionally parsing only `usecols`."""
     try:
-        df = pd.read_csv(file_path)
+        extra = {"dtype_backend": "pyarrow"} if engine == "pyarrow" else {}
+        df = pd.read_csv(file_path, engine=engine, usecols=usecols, **extra)
         print(f"✅ Loaded data with shape {df.shape}")
         return df
     except Exception as e:
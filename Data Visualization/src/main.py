@@ -3,7 +3,10 @@ import visualizer as viz
 
 def main():
     # Load dataset
-    df = load_csv("../data/sample.csv")
+    df = load_csv(
+        "../data/sample.csv",
+        usecols=["sepal_length", "sepal_width", "petal_length", "species"],
+    )
 
     if df.empty:
         return
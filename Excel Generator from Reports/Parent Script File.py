@@ -1,7 +1,25 @@
+import numpy as np
 import pandas as pd
 import re
 from openpyxl import load_workbook
 
+# Prefer Arrow-backed strings so the regex/strip/title kernels run in C++
+try:
+    import pyarrow  # noqa: F401
+    STRING_DTYPE = "string[pyarrow]"
+except ImportError:
+    STRING_DTYPE = "string"
+
+# Every character Python's \s matches, spelled out: under string[pyarrow] the
+# pattern runs on RE2, whose \s is ASCII-only and would miss e.g. NBSP (\xa0)
+_WHITESPACE_RUN = "[\t-\r\x1c-\x20\x85\xa0\u1680\u2000-\u200a\u2028\u2029\u202f\u205f\u3000]+"
+
+MONTH_NAMES = np.array(
+    ["January", "February", "March", "April", "May", "June",
+     "July", "August", "September", "October", "November", "December"],
+    dtype=object,
+)
+
 def clean_text(text: str) -> str:
     """Remove unwanted characters, extra spaces, and standardize casing."""
     if pd.isna(text):
@@ -11,6 +29,16 @@ def clean_text(text: str) -> str:
     text = text.strip()
     return text.title()  # standardize casing (optional)
 
+def clean_series(values):
+    """Vectorized clean_text for a whole Series or Index."""
+    return (
+        values.astype(STRING_DTYPE)
+        .str.replace(_WHITESPACE_RUN, " ", regex=True)
+        .str.strip()
+        .str.title()
+        .fillna("")
+    )
+
 def process_report(input_file: str, output_file: str, sheet_name: str = "CleanedData"):
     """
     Read raw report data, clean it, and export to Excel.
@@ -30,20 +58,26 @@ def process_report(input_file: str, output_file: str, sheet_name: str = "Cleaned
         raise ValueError("Unsupported file format. Use CSV or Excel.")
 
     # Step 2: Clean column names
-    df.columns = [clean_text(col) for col in df.columns]
+    df.columns = clean_series(df.columns)
 
     # Step 3: Clean text fields in the DataFrame
-    for col in df.select_dtypes(include=["object"]).columns:
-        df[col] = df[col].apply(clean_text)
+    obj_cols = df.select_dtypes(include=["object"]).columns
+    if len(obj_cols):
+        df[obj_cols] = df[obj_cols].apply(clean_series)
 
-    # Step 4: Remove duplicates and blank rows
-    df = df.drop_duplicates().dropna(how="all")
+    # Step 4: Remove blank rows and duplicates
+    df = df.loc[df.notna().any(axis=1)].drop_duplicates(ignore_index=True)
 
     # Step 5: Example of creating meaningful derived columns
     if "Date" in df.columns:
-        df["Date"] = pd.to_datetime(df["Date"], errors="coerce")
-        df["Year"] = df["Date"].dt.year
-        df["Month"] = df["Date"].dt.month_name()
+        dates = pd.to_datetime(df["Date"], errors="coerce")
+        months = dates.dt.month
+        df["Date"] = dates
+        df["Year"] = dates.dt.year.astype("Int16")
+        # Look month names up from a table instead of formatting each row
+        df["Month"] = np.where(
+            months.notna(), MONTH_NAMES[months.fillna(1).astype(int).to_numpy() - 1], None
+        )
 
     # Step 6: Export to Excel (append if file exists, else create new)
     try:
@@ -8,6 +8,7 @@ How to run:
     python hangman_console.py
 """
 
+import bisect
 import random
 import string
 import sys
@@ -23,6 +24,27 @@ WORDS = [
     "thread","process","concurrency","parallel","performance","optimize","compile","interpreter"
 ]
 
+# Word pools per difficulty, built once at import
+WORD_POOLS = {
+    "easy": tuple(w for w in WORDS if 4 <= len(w) <= 6),
+    "medium": tuple(w for w in WORDS if 6 <= len(w) <= 8),
+    "hard": tuple(w for w in WORDS if len(w) >= 9),
+}
+
+# Dedicated RNG so games can be seeded without touching the global `random`
+_rng = random.Random()
+_choose = _rng.choice
+
+def seed(x=None):
+    """Seed word selection, e.g. for reproducible tests."""
+    _rng.seed(x)
+
+_DIFF_MAP = {
+    "e": "easy", "easy": "easy",
+    "m": "medium", "medium": "medium",
+    "h": "hard", "hard": "hard",
+}
+
 HANGMAN_PICS = [
     """
      +---+
@@ -81,34 +103,35 @@ HANGMAN_PICS = [
          |
     ========="""
 ]
+_PICS_BY_LIVES = HANGMAN_PICS[::-1]  # indexed by lives remaining
+
+def letters_mask(word: str) -> int:
+    """Bitmask with bit (ord(c) - ord('a')) set for every letter in word."""
+    mask = 0
+    for c in word:
+        mask |= 1 << (ord(c) - 97)
+    return mask
 
 def choose_word(difficulty: str) -> str:
-    difficulty = difficulty.lower()
-    if difficulty == "easy":
-        candidates = [w for w in WORDS if 4 <= len(w) <= 6]
-    elif difficulty == "hard":
-        candidates = [w for w in WORDS if len(w) >= 9]
-    else:
-        candidates = [w for w in WORDS if 6 <= len(w) <= 8]
-    return random.choice(candidates) if candidates else random.choice(WORDS)
+    return _choose(WORD_POOLS.get(difficulty.lower(), WORD_POOLS["medium"]) or WORDS)
 
 def prompt_difficulty() -> str:
     print("Choose difficulty: [E]asy, [M]edium, [H]ard")
     while True:
-        choice = input("Your choice: ").strip().lower()
-        if choice in {"e","easy"}: return "easy"
-        if choice in {"m","medium"}: return "medium"
-        if choice in {"h","hard"}: return "hard"
-        print("Please type E, M, or H.")
-
-def print_state(secret, guessed, lives):
-    display = " ".join([c if c in guessed else "_" for c in secret])
-    print(HANGMAN_PICS[len(HANGMAN_PICS)-1 - lives])
+        try:
+            return _DIFF_MAP[input("Your choice: ").strip().lower()]
+        except KeyError:
+            print("Please type E, M, or H.")
+
+def print_state(secret, guessed_mask, guessed_sorted, lives):
+    hidden = {ord(c): "_" for c in set(secret) if not (guessed_mask >> (ord(c) - 97)) & 1}
+    display = " ".join(secret.translate(hidden))
+    print(_PICS_BY_LIVES[lives])
     print(f"\nWord: {display}")
-    print(f"Guessed: {' '.join(sorted(guessed)) if guessed else '(none)'}")
+    print(f"Guessed: {' '.join(guessed_sorted) if guessed_sorted else '(none)'}")
     print(f"Lives: {lives}\n")
 
-def get_letter(already):
+def get_letter(already_mask):
     while True:
         s = input("Guess a letter (or type ! to guess the whole word): ").strip().lower()
         if s == "!":
@@ -116,7 +139,7 @@ def get_letter(already):
         if len(s) != 1 or s not in string.ascii_lowercase:
             print("Please enter a single letter a-z.")
             continue
-        if s in already:
+        if (already_mask >> (ord(s) - 97)) & 1:
             print("You already tried that letter.")
             continue
         return s
@@ -125,12 +148,13 @@ def play_round():
     difficulty = prompt_difficulty()
     secret = choose_word(difficulty)
     lives = 6
-    guessed = set()
-    correct = set()
+    guessed_mask = 0
+    guessed_sorted = []  # kept in order with bisect.insort
+    secret_mask = letters_mask(secret)
     print("\nLet's play Hangman!\n")
     while lives > 0:
-        print_state(secret, guessed, lives)
-        letter = get_letter(guessed)
+        print_state(secret, guessed_mask, guessed_sorted, lives)
+        letter = get_letter(guessed_mask)
         if letter == "!":
             attempt = input("Enter your full word guess: ").strip().lower()
             if attempt == secret:
@@ -140,18 +164,18 @@ def play_round():
                 print("Nope! That's not the word. You lose 2 lives.")
                 lives -= 2
                 continue
-        guessed.add(letter)
+        guessed_mask |= 1 << (ord(letter) - 97)
+        bisect.insort(guessed_sorted, letter)
         if letter in secret:
             print("Nice! That letter is in the word.")
-            correct.add(letter)
-            if all(c in guessed for c in set(secret)):
-                print_state(secret, guessed, lives)
+            if (guessed_mask & secret_mask) == secret_mask:
+                print_state(secret, guessed_mask, guessed_sorted, lives)
                 print(f"🎉 You revealed the word '{secret}'! You win!")
                 return True
         else:
             print("Sorry, not in the word.")
             lives -= 1
-    print_state(secret, guessed, 0)
+    print_state(secret, guessed_mask, guessed_sorted, 0)
     print(f"💀 Out of lives. The word was '{secret}'. Better luck next time!")
     return False
 
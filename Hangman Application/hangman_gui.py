@@ -12,6 +12,7 @@ How to run:
 import random
 import string
 import tkinter as tk
+from functools import partial
 from tkinter import messagebox
 
 WORDS = [
@@ -25,6 +26,40 @@ WORDS = [
     "thread","process","concurrency","parallel","performance","optimize","compile","interpreter"
 ]
 
+# Word pools per difficulty, built once at import
+WORD_POOLS = {
+    "easy": tuple(w for w in WORDS if 4 <= len(w) <= 6),
+    "medium": tuple(w for w in WORDS if 6 <= len(w) <= 8),
+    "hard": tuple(w for w in WORDS if len(w) >= 9),
+}
+
+# Dedicated RNG so games can be seeded without touching the global `random`
+_rng = random.Random()
+_choose = _rng.choice
+
+def seed(x=None):
+    """Seed word selection, e.g. for reproducible tests."""
+    _rng.seed(x)
+
+def letters_mask(word):
+    """Bitmask with bit (ord(c) - ord('a')) set for every letter in word."""
+    mask = 0
+    for c in word:
+        mask |= 1 << (ord(c) - 97)
+    return mask
+
+ALL_LETTERS = (1 << 26) - 1  # every a-z bit set
+
+# Gallows parts revealed per wrong guess (stage 1..6)
+BODY_PARTS = {
+    1: ("oval", (175, 80, 225, 130)),  # head
+    2: ("line", (200, 130, 200, 200)),  # body
+    3: ("line", (200, 150, 170, 180)),  # left arm
+    4: ("line", (200, 150, 230, 180)),  # right arm
+    5: ("line", (200, 200, 175, 240)),  # left leg
+    6: ("line", (200, 200, 225, 240)),  # right leg
+}
+
 class HangmanGame:
     def __init__(self, root):
         self.root = root
@@ -62,9 +97,10 @@ class HangmanGame:
             rowf = tk.Frame(self.kb_frame)
             rowf.pack()
             for ch in letters:
-                b = tk.Button(rowf, text=ch.upper(), width=3, command=lambda c=ch: self.guess_letter(c))
+                b = tk.Button(rowf, text=ch.upper(), width=3, command=partial(self.guess_letter, ch))
                 b.pack(side=tk.LEFT, padx=2, pady=2)
                 self.buttons[ch] = b
+        root.bind("<Key>", self._on_key)
 
         self.status_var = tk.StringVar(value="")
         self.lbl_status = tk.Label(root, textvariable=self.status_var, font=("Arial", 11))
@@ -74,23 +110,19 @@ class HangmanGame:
         self.score_losses = 0
 
         self.secret = ""
-        self.guessed = set()
+        self.guessed_mask = 0
+        self._secret_mask = 0
         self.lives = 6
 
         self.new_game()
 
     def choose_word(self, difficulty):
-        if difficulty == "easy":
-            pool = [w for w in WORDS if 4 <= len(w) <= 6]
-        elif difficulty == "hard":
-            pool = [w for w in WORDS if len(w) >= 9]
-        else:
-            pool = [w for w in WORDS if 6 <= len(w) <= 8]
-        return random.choice(pool if pool else WORDS)
+        return _choose(WORD_POOLS.get(difficulty, WORD_POOLS["medium"]) or WORDS)
 
     def new_game(self):
         self.secret = self.choose_word(self.diff_var.get())
-        self.guessed = set()
+        self.guessed_mask = 0
+        self._secret_mask = letters_mask(self.secret)
         self.lives = 6
         for ch, btn in self.buttons.items():
             btn.config(state=tk.NORMAL)
@@ -100,18 +132,29 @@ class HangmanGame:
         self.draw_gallows(stage=0)
 
     def update_word_label(self):
-        display = " ".join([c.upper() if c in self.guessed else "_" for c in self.secret])
+        hidden = {ord(c): "_" for c in set(self.secret) if not (self.guessed_mask >> (ord(c) - 97)) & 1}
+        display = " ".join(self.secret.translate(hidden).upper())
         self.word_var.set(display)
 
+    def _on_key(self, event):
+        # Only ASCII letters: str.lower() can grow other characters (e.g. 'İ' -> 2 chars)
+        if len(event.char) == 1 and event.char in string.ascii_letters:
+            self.guess_letter(event.char.lower())
+
     def guess_letter(self, ch):
-        if ch in self.guessed:
+        # Non-letters and repeats are rejected with int ops before touching any widget
+        idx = ord(ch) - 97
+        if idx < 0 or idx > 25:
+            return
+        bit = 1 << idx
+        if self.guessed_mask & bit:
             return
-        self.guessed.add(ch)
+        self.guessed_mask |= bit
         self.buttons[ch].config(state=tk.DISABLED)
-        if ch in self.secret:
+        if self._secret_mask & bit:
             self.info_var.set(f"Nice! '{ch.upper()}' is in the word.")
             self.update_word_label()
-            if all(c in self.guessed for c in set(self.secret)):
+            if (self.guessed_mask & self._secret_mask) == self._secret_mask:
                 self.end_game(win=True)
         else:
             self.lives -= 1
@@ -121,6 +164,7 @@ class HangmanGame:
                 self.end_game(win=False)
 
     def end_game(self, win):
+        self.guessed_mask = ALL_LETTERS  # ignore further guesses until new_game
         for btn in self.buttons.values():
             btn.config(state=tk.DISABLED)
         if win:
@@ -132,29 +176,23 @@ class HangmanGame:
         self.status_var.set(f"Wins: {self.score_wins}   Losses: {self.score_losses}")
 
     def draw_gallows(self, stage):
-        # clear
-        self.canvas.delete("all")
-        w, h = 420, 320
-        # base
-        self.canvas.create_line(40, 280, 200, 280, width=4)
-        self.canvas.create_line(80, 280, 80, 50, width=4)
-        self.canvas.create_line(80, 50, 200, 50, width=4)
-        self.canvas.create_line(200, 50, 200, 80, width=4)
-
-        # Draw parts based on stage (0..6)
-        # 1: head, 2: body, 3: left arm, 4: right arm, 5: left leg, 6: right leg
-        if stage >= 1:
-            self.canvas.create_oval(175, 80, 225, 130, width=3)  # head
-        if stage >= 2:
-            self.canvas.create_line(200, 130, 200, 200, width=3)  # body
-        if stage >= 3:
-            self.canvas.create_line(200, 150, 170, 180, width=3)  # left arm
-        if stage >= 4:
-            self.canvas.create_line(200, 150, 230, 180, width=3)  # right arm
-        if stage >= 5:
-            self.canvas.create_line(200, 200, 175, 240, width=3)  # left leg
-        if stage >= 6:
-            self.canvas.create_line(200, 200, 225, 240, width=3)  # right leg
+        # Stage 0 clears the canvas and draws the scaffold; later stages add one part each
+        if stage == 0:
+            self.canvas.delete("all")
+            self.canvas.create_line(40, 280, 200, 280, width=4)
+            self.canvas.create_line(80, 280, 80, 50, width=4)
+            self.canvas.create_line(80, 50, 200, 50, width=4)
+            self.canvas.create_line(200, 50, 200, 80, width=4)
+            return
+
+        tag = f"p{stage}"
+        if stage not in BODY_PARTS or self.canvas.find_withtag(tag):
+            return
+        kind, coords = BODY_PARTS[stage]
+        if kind == "oval":
+            self.canvas.create_oval(*coords, width=3, tags=(tag,))
+        else:
+            self.canvas.create_line(*coords, width=3, tags=(tag,))
 
 def main():
     root = tk.Tk()
@@ -1,7 +1,9 @@
 import csv
 import os
+from collections import Counter
 
 FILE_NAME = "job_tracker.csv"
+FLUSH_BYTES = 64 * 1024  # write buffer for the rewritten file, so rows go out in chunks this size
 
 # Ensure CSV exists
 def init_file():
@@ -10,46 +12,74 @@ def init_file():
             writer = csv.writer(file)
             writer.writerow(["Company", "Role", "Status"])  # Status: Applied, Interview, Offer, Rejected
 
+# Append applications through one open file and writer (use this for bulk imports)
+class JobTracker:
+    def __enter__(self):
+        self._file = open(FILE_NAME, mode="a", newline="")
+        self._writer = csv.writer(self._file)
+        return self
+
+    def add(self, company, role):
+        self._writer.writerow([company, role, "Applied"])
+
+    def __exit__(self, *exc):
+        self._file.close()
+
 # Add a new application
 def add_application(company, role):
-    with open(FILE_NAME, mode="a", newline="") as file:
-        writer = csv.writer(file)
-        writer.writerow([company, role, "Applied"])
+    with JobTracker() as tracker:
+        tracker.add(company, role)
     print(f"Application added: {company} - {role}")
 
 # Update status (Interview, Offer, Rejected)
 def update_status(company, role, status):
-    rows = []
-    updated = False
-    with open(FILE_NAME, mode="r") as file:
-        reader = csv.reader(file)
-        rows = list(reader)
-
-    for row in rows:
-        if row[0] == company and row[1] == role:
-            row[2] = status
-            updated = True
-            break
-
-    with open(FILE_NAME, mode="w", newline="") as file:
-        writer = csv.writer(file)
-        writer.writerows(rows)
-
-    if updated:
+    if update_many([(company, role, status)]):
         print(f"Status updated: {company} - {role} → {status}")
     else:
         print("Application not found.")
 
+# Apply several (company, role, status) updates in one pass; returns the ones applied
+def update_many(updates):
+    pending = {(company, role): status for company, role, status in updates}
+    applied = []
+    # Stream rows into a temp file, then swap it in atomically
+    tmp_name = FILE_NAME + ".tmp"
+    try:
+        with open(FILE_NAME, mode="r", newline="") as src, \
+                open(tmp_name, mode="w", newline="", buffering=FLUSH_BYTES) as dst:
+            writer = csv.writer(dst)
+            for row in csv.reader(src):
+                status = pending.pop((row[0], row[1]), None)
+                if status is not None:
+                    row[2] = status
+                    applied.append((row[0], row[1], status))
+                writer.writerow(row)
+                if not pending:
+                    break
+            dst.write(src.read())  # copy everything after the last match as-is
+    except BaseException:
+        # Don't leave a half-written temp file behind (e.g. a short row in the CSV)
+        if os.path.exists(tmp_name):
+            os.remove(tmp_name)
+        raise
+
+    if applied:
+        os.replace(tmp_name, FILE_NAME)
+    else:
+        os.remove(tmp_name)
+    return applied
+
 # Show stats
 def show_stats():
-    with open(FILE_NAME, mode="r") as file:
-        reader = csv.DictReader(file)
-        applications = list(reader)
+    with open(FILE_NAME, mode="r", newline="") as file:
+        reader = csv.reader(file)
+        next(reader, None)  # skip header
+        counts = Counter(row[2] for row in reader if row)  # column 2 is Status
 
-    total = len(applications)
-    interviews = sum(1 for a in applications if a["Status"] == "Interview")
-    offers = sum(1 for a in applications if a["Status"] == "Offer")
-    rejections = sum(1 for a in applications if a["Status"] == "Rejected")
+    total = sum(counts.values())
+    interviews = counts["Interview"]
+    offers = counts["Offer"]
+    rejections = counts["Rejected"]
 
     print("\n--- Job Search Stats ---")
     print(f"Total Applications: {total}")
@@ -62,6 +92,9 @@ def show_stats():
 if __name__ == "__main__":
     init_file()
     # add_application("Google", "Software Engineer")
+    # with JobTracker() as tracker:
+    #     for company, role in [("Google", "SWE"), ("Meta", "SRE")]:
+    #         tracker.add(company, role)
     # update_status("Google", "Software Engineer", "Interview")
     # update_status("Google", "Software Engineer", "Offer")
     show_stats()
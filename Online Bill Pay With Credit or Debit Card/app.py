@@ -15,7 +15,8 @@ try:
 except Exception:
     stripe = None
 
-if stripe and STRIPE_SECRET_KEY:
+_STRIPE_ENABLED = bool(stripe and STRIPE_SECRET_KEY)
+if _STRIPE_ENABLED:
     stripe.api_key = STRIPE_SECRET_KEY
 
 app = Flask(__name__)
@@ -27,32 +28,69 @@ CURRENCY = "usd"
 TAX_RATE = Decimal("0.0825")  # 8.25% sales tax
 SHIPPING_FLAT = Decimal("4.99")  # flat shipping fee
 
-def to_decimal(value: str) -> Decimal:
-    """Safe conversion to Decimal with 2dp, rejecting negatives."""
-    try:
-        d = Decimal(value)
-    except (InvalidOperation, TypeError):
-        raise ValueError("Invalid number.")
-    if d < 0:
-        raise ValueError("Amount cannot be negative.")
-    # Normalize to 2 decimal places for currency
-    return d.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
-
-def calc_totals(subtotal: Decimal):
+_CENTS = Decimal("0.01")
+_HUNDRED = Decimal(100)
+# Totals are computed in integer cents; TAX_RATE must be a whole number of basis points
+_TAX_BPS = int(TAX_RATE * 10000)
+
+class Money:
+    """Fixed-point currency amount, stored as integer cents."""
+    __slots__ = ("c",)
+
+    def __init__(self, cents: int):
+        self.c = cents
+
+    @classmethod
+    def parse(cls, value) -> "Money":
+        """Safe conversion from user input, rounded half up to cents, rejecting negatives."""
+        try:
+            d = Decimal(value)
+        except (InvalidOperation, TypeError):
+            raise ValueError("Invalid number.")
+        if not d.is_finite():
+            raise ValueError("Invalid number.")
+        if d < 0:
+            raise ValueError("Amount cannot be negative.")
+        # quantize traps amounts too large for the context instead of building a huge int
+        try:
+            d = d.quantize(_CENTS, rounding=ROUND_HALF_UP)
+        except InvalidOperation:
+            raise ValueError("Invalid number.")
+        return cls(int(d * _HUNDRED))
+
+    def __add__(self, other: "Money") -> "Money":
+        return Money(self.c + other.c)
+
+    def __eq__(self, other):
+        if not isinstance(other, Money):
+            return NotImplemented
+        return self.c == other.c
+
+    def __hash__(self) -> int:
+        return hash(self.c)
+
+    def __repr__(self) -> str:
+        return f"Money({self.c})"
+
+    def to_decimal(self) -> Decimal:
+        # scaleb keeps two decimal places (e.g. 5.00) for display
+        return Decimal(self.c).scaleb(-2)
+
+_SHIPPING = Money.parse(SHIPPING_FLAT)
+
+# Stripe Checkout price_data skeleton; /pay fills in name and amount per request
+_PRICE_DATA_TMPL = {"currency": CURRENCY, "product_data": {"name": ""}, "unit_amount": 0}
+
+def calc_totals(subtotal: Money):
     """Return a dict with detailed totals."""
-    tax = (subtotal * TAX_RATE).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
-    shipping = SHIPPING_FLAT
-    total = (subtotal + tax + shipping).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+    tax = Money((subtotal.c * _TAX_BPS + 5000) // 10000)  # round half up
     return {
         "subtotal": subtotal,
         "tax": tax,
-        "shipping": shipping,
-        "total": total,
+        "shipping": _SHIPPING,
+        "total": subtotal + tax + _SHIPPING,
     }
 
-def dollars_to_cents(dec_amount: Decimal) -> int:
-    return int((dec_amount * 100).quantize(Decimal("1"), rounding=ROUND_HALF_UP))
-
 @app.route("/", methods=["GET"])
 def index():
     return render_template("index.html", publishable_key=STRIPE_PUBLISHABLE_KEY, currency=CURRENCY.upper())
@@ -64,7 +102,7 @@ def calculate():
     email = request.form.get("email", "").strip()
 
     try:
-        subtotal = to_decimal(amount_str)
+        subtotal = Money.parse(amount_str)
     except ValueError as e:
         flash(str(e), "error")
         return redirect(url_for("index"))
@@ -77,31 +115,28 @@ def calculate():
         "summary.html",
         description=description,
         email=email,
-        subtotal=breakdown["subtotal"],
-        tax=breakdown["tax"],
-        shipping=breakdown["shipping"],
-        total=breakdown["total"],
+        subtotal=breakdown["subtotal"].to_decimal(),
+        tax=breakdown["tax"].to_decimal(),
+        shipping=breakdown["shipping"].to_decimal(),
+        total=breakdown["total"].to_decimal(),
         currency=CURRENCY.upper(),
-        stripe_enabled=bool(stripe and STRIPE_SECRET_KEY),
+        stripe_enabled=_STRIPE_ENABLED,
     )
 
 @app.route("/pay", methods=["POST"])
 def pay():
     description = request.form.get("description", "Online Bill")
     email = request.form.get("email", "").strip()
-    subtotal = to_decimal(request.form.get("subtotal"))
-    tax = to_decimal(request.form.get("tax"))
-    shipping = to_decimal(request.form.get("shipping"))
-    total = to_decimal(request.form.get("total"))
-
-    # Safety: recompute totals server-side
-    recomputed = calc_totals(subtotal)
-    if recomputed["tax"] != tax or recomputed["shipping"] != shipping or recomputed["total"] != total:
+    subtotal = Money.parse(request.form.get("subtotal"))
+    total = Money.parse(request.form.get("total"))
+
+    # Safety: recompute totals server-side (tax and shipping are derived, so the total is enough)
+    if calc_totals(subtotal)["total"] != total:
         flash("Total mismatch; please try again.", "error")
         return redirect(url_for("index"))
 
     # If Stripe is configured, use Checkout
-    if stripe and STRIPE_SECRET_KEY:
+    if _STRIPE_ENABLED:
         try:
             session = stripe.checkout.Session.create(
                 mode="payment",
@@ -109,9 +144,9 @@ def pay():
                 line_items=[
                     {
                         "price_data": {
-                            "currency": CURRENCY,
+                            **_PRICE_DATA_TMPL,
                             "product_data": {"name": description},
-                            "unit_amount": dollars_to_cents(total),
+                            "unit_amount": total.c,
                         },
                         "quantity": 1,
                     }